@@ -5,15 +5,17 @@ try:
 except ImportError:
     __version__ = "0.0.0"
 
-from synchromcp.config import ConfigLocation, discover_configs
+from synchromcp.config import ConfigLocation, clear_discovery_cache, discover_configs
 from synchromcp.models import McpServer, McpServersConfig
-from synchromcp.sync import sync_configs
+from synchromcp.sync import sync_configs, sync_configs_stream
 
 __all__ = [
     "ConfigLocation",
     "McpServer",
     "McpServersConfig",
     "__version__",
+    "clear_discovery_cache",
     "discover_configs",
     "sync_configs",
+    "sync_configs_stream",
 ]
@@ -0,0 +1,72 @@
+"""Optional fast serialization backends with pure-Python fallbacks."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON from UTF-8 bytes."""
+        return json.loads(data)
+
+    def json_dumps(data: Any) -> bytes:
+        """Serialize data to pretty-printed, newline-terminated UTF-8 JSON."""
+        return (json.dumps(data, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+else:
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON from UTF-8 bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(data: Any) -> bytes:
+        """Serialize data to pretty-printed, newline-terminated UTF-8 JSON."""
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_APPEND_NEWLINE
+            | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - simdjson is an optional speedup
+
+    def json_load_section(data: bytes, keys: tuple[str, ...]) -> Any:
+        """Parse JSON and return the value at a key path (None if missing)."""
+        current = json_loads(data)
+        for key in keys:
+            if not isinstance(current, dict) or key not in current:
+                return None
+            current = current[key]
+        return current
+
+else:
+
+    def json_load_section(data: bytes, keys: tuple[str, ...]) -> Any:
+        """Parse JSON and return the value at a key path (None if missing).
+
+        Only the selected subtree is converted into Python objects.
+        """
+        current: Any = simdjson.Parser().parse(data)
+        for key in keys:
+            if not isinstance(current, simdjson.Object):
+                return None
+            current = current.get(key)
+        if isinstance(current, simdjson.Object):
+            return current.as_dict()
+        if isinstance(current, simdjson.Array):
+            return current.as_list()
+        return current
+
+
+def toml_dumps(data: dict[str, Any]) -> bytes:
+    """Serialize data to UTF-8 TOML."""
+    import tomli_w  # Only loaded once a TOML config is actually written
+
+    return tomli_w.dumps(data).encode("utf-8")
@@ -5,21 +5,94 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-import fire  # type: ignore[import-untyped]
-from loguru import logger
-from rich.console import Console
-from rich.table import Table
-
+from synchromcp import __version__
+from synchromcp._compat import json_dumps
 from synchromcp.config import discover_configs, get_default_source
 from synchromcp.readers import read_config
-from synchromcp.sync import load_source, sync_configs
+from synchromcp.sync import load_source, load_source_servers, sync_configs
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+def _get_console() -> Console:
+    """Return the shared rich console, importing rich on first use."""
+    console: Console | None = globals().get("console")
+    if console is None:
+        from rich.console import Console
+
+        console = globals()["console"] = Console()
+    return console
+
+
+def __getattr__(name: str) -> Any:
+    """Create the module-level ``console`` lazily."""
+    if name == "console":
+        return _get_console()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+# The schema is static, so serialize it once at import
+_SCHEMA_JSON: bytes = json_dumps(
+    {
+        "$schema": "http://json-schema.org/draft-07/schema#",
+        "title": "MCP Servers Configuration",
+        "type": "object",
+        "additionalProperties": {"$ref": "#/definitions/McpServer"},
+        "definitions": {
+            "McpServer": {
+                "type": "object",
+                "properties": {
+                    "command": {
+                        "type": "string",
+                        "description": "Executable command (stdio transport)",
+                    },
+                    "args": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Command arguments",
+                    },
+                    "env": {
+                        "type": "object",
+                        "additionalProperties": {"type": "string"},
+                        "description": "Environment variables",
+                    },
+                    "cwd": {"type": "string", "description": "Working directory"},
+                    "url": {
+                        "type": "string",
+                        "format": "uri",
+                        "description": "URL (HTTP transport)",
+                    },
+                    "type": {
+                        "type": "string",
+                        "enum": ["stdio", "sse", "streamable-http"],
+                        "description": "Transport type",
+                    },
+                    "disabled": {
+                        "type": "boolean",
+                        "description": "Whether server is disabled",
+                    },
+                    "alwaysAllow": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Auto-approved tools",
+                    },
+                },
+                "oneOf": [{"required": ["command"]}, {"required": ["url"]}],
+            }
+        },
+    }
+)
 
-# Configure loguru
-logger.remove()
-logger.add(sys.stderr, format="{message}", level="INFO")
 
-console = Console()
+def _write_stdout(data: bytes) -> None:
+    """Write already-encoded output to stdout, keeping text output in order."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
 
 
 class SynchroCLI:
@@ -31,9 +104,13 @@ class SynchroCLI:
         Args:
             mounts: Comma-separated list of mount points to search
         """
+        from rich.table import Table
+
+        console = _get_console()
         mount_list = mounts.split(",") if mounts else None
         configs = discover_configs(mount_list)
         default_source = get_default_source()
+        default_resolved = default_source.resolve() if default_source else None
 
         table = Table(title="Discovered MCP Config Files")
         table.add_column("App", style="cyan")
@@ -43,7 +120,8 @@ class SynchroCLI:
 
         for config in configs:
             is_source = (
-                default_source and config.path.resolve() == default_source.resolve()
+                default_resolved is not None
+                and config.path.resolve() == default_resolved
             )
             status = "[source]" if is_source else ""
 
@@ -60,23 +138,29 @@ class SynchroCLI:
         else:
             console.print("[yellow]No MCP config files found[/yellow]")
 
-    def show(self, source: str | None = None) -> None:
+    def show(self, source: str | None = None, validate: bool = False) -> None:
         """Show MCP servers from a config file.
 
         Args:
             source: Path to config file (default: Claude Desktop)
+            validate: Check the servers as sync does and show them as sync
+                would write them, instead of as stored
         """
+        console = _get_console()
         try:
             source_path = Path(source) if source else None
-            path, config = load_source(source_path)
+            if validate:
+                path, config = load_source(source_path)
+                servers = config.to_dict()
+            else:
+                path, servers = load_source_servers(source_path)
 
             console.print(f"[cyan]Source:[/cyan] {path}\n")
 
-            # Pretty print the config
-            output = json.dumps(config.to_dict(), indent=2)
-            console.print(output)
+            # Pretty print the config; raw bytes bypass rich markup parsing
+            _write_stdout(json_dumps(servers))
 
-            console.print(f"\n[green]{len(config.servers)} server(s)[/green]")
+            console.print(f"\n[green]{len(servers)} server(s)[/green]")
 
         except FileNotFoundError as e:
             console.print(f"[red]Error:[/red] {e}")
@@ -100,6 +184,9 @@ class SynchroCLI:
             mounts: Comma-separated list of mount points for external volumes
             dry_run: Show what would change without writing
         """
+        from rich.table import Table
+
+        console = _get_console()
         source_path = Path(source) if source else None
         target_list = targets.split(",") if targets else None
         mount_list = mounts.split(",") if mounts else None
@@ -149,27 +236,15 @@ class SynchroCLI:
         Args:
             path: Path to config file to validate
         """
-        from synchromcp.config import ConfigLocation, FileType, McpKey
+        console = _get_console()
+        from synchromcp.config import guess_location
 
         config_path = Path(path)
         if not config_path.exists():
             console.print(f"[red]File not found:[/red] {path}")
             sys.exit(1)
 
-        # Guess file type
-        if config_path.suffix.lower() == ".toml":
-            file_type = FileType.TOML
-            mcp_key = McpKey.SNAKE
-        else:
-            file_type = FileType.JSON
-            mcp_key = McpKey.CAMEL
-
-        location = ConfigLocation(
-            app_name="Validation",
-            path_template="",
-            file_type=file_type,
-            mcp_key=mcp_key,
-        )
+        location = guess_location(config_path, "Validation")
 
         try:
             _, config = read_config(config_path, location)
@@ -199,59 +274,23 @@ class SynchroCLI:
 
     def schema(self) -> None:
         """Output the JSON schema for mcpServers."""
-        schema = {
-            "$schema": "http://json-schema.org/draft-07/schema#",
-            "title": "MCP Servers Configuration",
-            "type": "object",
-            "additionalProperties": {"$ref": "#/definitions/McpServer"},
-            "definitions": {
-                "McpServer": {
-                    "type": "object",
-                    "properties": {
-                        "command": {
-                            "type": "string",
-                            "description": "Executable command (stdio transport)",
-                        },
-                        "args": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Command arguments",
-                        },
-                        "env": {
-                            "type": "object",
-                            "additionalProperties": {"type": "string"},
-                            "description": "Environment variables",
-                        },
-                        "cwd": {"type": "string", "description": "Working directory"},
-                        "url": {
-                            "type": "string",
-                            "format": "uri",
-                            "description": "URL (HTTP transport)",
-                        },
-                        "type": {
-                            "type": "string",
-                            "enum": ["stdio", "sse", "streamable-http"],
-                            "description": "Transport type",
-                        },
-                        "disabled": {
-                            "type": "boolean",
-                            "description": "Whether server is disabled",
-                        },
-                        "alwaysAllow": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Auto-approved tools",
-                        },
-                    },
-                    "oneOf": [{"required": ["command"]}, {"required": ["url"]}],
-                }
-            },
-        }
-        print(json.dumps(schema, indent=2))
+        _write_stdout(_SCHEMA_JSON)
 
 
 def main() -> None:
     """Entry point for the CLI."""
+    # Answer --version without importing fire or rich
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print(__version__)
+        return
+
+    import fire  # type: ignore[import-untyped]
+    from loguru import logger
+
+    # Configure loguru
+    logger.remove()
+    logger.add(sys.stderr, format="{message}", level="INFO")
+
     fire.Fire(SynchroCLI)
 
 
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import platform
-from dataclasses import dataclass
-from enum import Enum
+import string
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum, StrEnum
 from pathlib import Path
 
 
@@ -16,14 +19,79 @@ class FileType(Enum):
     TOML = "toml"
 
 
-class McpKey(Enum):
-    """Key name for MCP servers section."""
+class McpKey(StrEnum):
+    """Key name for MCP servers section; members are the key strings."""
 
     CAMEL = "mcpServers"  # JSON files
     SNAKE = "mcp_servers"  # TOML files
 
 
-@dataclass
+def _darwin_dirs(base: str, home: str) -> tuple[str, str]:
+    """Return (appdata, config) directories for macOS."""
+    return (
+        os.path.join(base, "Library", "Application Support"),
+        os.path.join(base, ".config"),
+    )
+
+
+def _windows_dirs(base: str, home: str) -> tuple[str, str]:
+    """Return (appdata, config) directories for Windows."""
+    roaming = os.path.join(base, "AppData", "Roaming")
+    # For mounts, appdata is always relative to base
+    appdata = os.environ.get("APPDATA", roaming) if base == home else roaming
+    return appdata, appdata
+
+
+def _linux_dirs(base: str, home: str) -> tuple[str, str]:
+    """Return (appdata, config) directories for Linux."""
+    config = os.path.join(base, ".config")
+    return config, config
+
+
+# The platform never changes during a process, so resolve it once
+_SYSTEM = platform.system()
+_EXPAND_DIRS: Callable[[str, str], tuple[str, str]] = {
+    "Darwin": _darwin_dirs,
+    "Windows": _windows_dirs,
+}.get(_SYSTEM, _linux_dirs)
+
+
+# Placeholders supported in path templates, in expander argument order
+_PLACEHOLDERS = ("home", "appdata", "config")
+
+_Expander = Callable[[str, str, str], str]
+
+
+def _compile_template(template: str) -> _Expander | None:
+    """Compile a path template into a function of (home, appdata, config).
+
+    Args:
+        template: Path template using {home}, {appdata}, {config} placeholders
+
+    Returns:
+        The expander, or None if the template uses an unknown placeholder
+    """
+    segments: list[tuple[str, int | None]] = []
+    for literal, name, _, _ in string.Formatter().parse(template):
+        if name is not None and name not in _PLACEHOLDERS:
+            return None
+        segments.append(
+            (literal, _PLACEHOLDERS.index(name) if name is not None else None)
+        )
+
+    # Every known template is "{placeholder}/rest"; make that a single concat
+    if len(segments) == 2:
+        (head, index), (tail, last) = segments
+        if not head and index is not None and last is None:
+            return lambda *dirs: dirs[index] + tail
+
+    parts = tuple(segments)
+    return lambda *dirs: "".join(
+        literal + (dirs[index] if index is not None else "") for literal, index in parts
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class ConfigLocation:
     """A known MCP config file location."""
 
@@ -31,9 +99,19 @@ class ConfigLocation:
     path_template: str  # Uses {home}, {appdata}, {config} placeholders
     file_type: FileType
     mcp_key: McpKey
-    nested_path: list[str] | None = (
-        None  # For nested mcpServers (e.g., ["mcp", "servers"])
+    nested_path: tuple[str, ...] | None = (
+        None  # For nested mcpServers (e.g., ("mcp", "servers"))
     )
+    # path_template compiled into a function of (home, appdata, config)
+    _expander: _Expander | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the path template once instead of on every expansion."""
+        # Frozen instances can only be set up through object.__setattr__;
+        # nested_path is stored as a tuple so locations stay hashable
+        if self.nested_path is not None:
+            object.__setattr__(self, "nested_path", tuple(self.nested_path))
+        object.__setattr__(self, "_expander", _compile_template(self.path_template))
 
     def expand_path(self, home: Path, mounts: list[Path] | None = None) -> list[Path]:
         """Expand path template to actual paths.
@@ -45,47 +123,27 @@ class ConfigLocation:
         Returns:
             List of expanded paths that exist
         """
+        home_str = str(home)
+        bases = (home_str, *(str(mount) for mount in mounts or ()))
+        listings: dict[str, _Listing] = {}
         paths: list[Path] = []
-        bases = [home]
-        if mounts:
-            bases.extend(mounts)
 
+        # Look names up in cached directory listings instead of one stat each
         for base in bases:
-            expanded = self._expand_for_base(base, home)
-            if expanded and expanded.exists():
-                paths.append(expanded)
+            path = self._expand_str(base, home_str)
+            if path is None:
+                continue
+            parent, name = os.path.split(os.path.expanduser(path))
+            if _has_entry(parent, name, listings, bases):
+                paths.append(Path(parent, name))
 
         return paths
 
-    def _expand_for_base(self, base: Path, home: Path) -> Path | None:
-        """Expand path for a specific base directory."""
-        template = self.path_template
-
-        # Platform-specific replacements
-        system = platform.system()
-
-        if system == "Darwin":  # macOS
-            appdata = base / "Library" / "Application Support"
-            config = base / ".config"
-        elif system == "Windows":
-            appdata = Path(os.environ.get("APPDATA", base / "AppData" / "Roaming"))
-            if base != home:
-                # For mounts, adjust appdata relative to base
-                appdata = base / "AppData" / "Roaming"
-            config = appdata
-        else:  # Linux
-            appdata = base / ".config"
-            config = base / ".config"
-
-        try:
-            path_str = template.format(
-                home=str(base),
-                appdata=str(appdata),
-                config=str(config),
-            )
-            return Path(path_str).expanduser()
-        except KeyError:
+    def _expand_str(self, base: str, home: str) -> str | None:
+        """Expand path for a base directory, without creating Path objects."""
+        if self._expander is None:
             return None
+        return self._expander(base, *_EXPAND_DIRS(base, home))
 
 
 # All known MCP config locations
@@ -232,8 +290,12 @@ KNOWN_LOCATIONS: list[ConfigLocation] = [
     ),
 ]
 
+_LOCATIONS_BY_APP: dict[str, ConfigLocation] = {
+    location.app_name: location for location in KNOWN_LOCATIONS
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class DiscoveredConfig:
     """A discovered config file with its metadata."""
 
@@ -241,36 +303,146 @@ class DiscoveredConfig:
     path: Path
 
 
+_Listing = dict[str, os.DirEntry[str]]
+
+
+def _list_dir(
+    directory: str,
+    listings: dict[str, _Listing],
+    roots: tuple[str, ...] = (),
+) -> _Listing:
+    """Return the entries of a directory by name, scanning it only once.
+
+    Below one of ``roots``, a directory is only scanned if its parent's
+    listing contains it as a directory, so templates sharing a missing
+    ancestor (e.g. ``{appdata}/Code/User/globalStorage``) cost a single
+    parent scan instead of one failed open per template.
+
+    Args:
+        directory: Directory to list
+        listings: Cache of already-scanned directories
+        roots: Base directories that are always scanned directly
+
+    Returns:
+        Directory entries keyed by name (empty if the directory is unreadable)
+    """
+    entries = listings.get(directory)
+    if entries is None:
+        parent, name = os.path.split(directory)
+        if (
+            directory not in roots
+            and any(
+                parent == root or parent.startswith(root + os.sep) for root in roots
+            )
+            and not _has_entry(parent, name, listings, roots, os.DirEntry.is_dir)
+        ):
+            entries = {}
+        else:
+            try:
+                with os.scandir(directory) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = {}
+        listings[directory] = entries
+    return entries
+
+
+def _has_entry(
+    directory: str,
+    name: str,
+    listings: dict[str, _Listing],
+    roots: tuple[str, ...],
+    check: Callable[[os.DirEntry[str]], bool] = os.DirEntry.is_file,
+) -> bool:
+    """Check a directory listing for an entry of the right kind.
+
+    DirEntry answers from the type reported by scandir, so only symlinks,
+    which are followed, need an extra stat.
+    """
+    entry = _list_dir(directory, listings, roots).get(name)
+    return entry is not None and check(entry)
+
+
+@functools.lru_cache(maxsize=16)
+def _discover(home: str, mounts: tuple[str, ...]) -> tuple[DiscoveredConfig, ...]:
+    """Discover config files for a home directory and mount points (cached)."""
+    bases = (home, *mounts)
+    listings: dict[str, _Listing] = {}
+    discovered: list[DiscoveredConfig] = []
+
+    # One scandir per unique parent directory instead of one stat per candidate;
+    # paths stay plain strings until a config file is actually found
+    for location in KNOWN_LOCATIONS:
+        for base in bases:
+            path = location._expand_str(base, home)
+            if path is None:
+                continue
+            parent, name = os.path.split(path)
+            if _has_entry(parent, name, listings, bases):
+                discovered.append(DiscoveredConfig(location=location, path=Path(path)))
+
+    return tuple(discovered)
+
+
 def discover_configs(
     mounts: list[str] | None = None,
 ) -> list[DiscoveredConfig]:
     """Discover all MCP config files on the system.
 
+    Results are cached per home directory and mount points for the lifetime
+    of the process; call clear_discovery_cache() to pick up files created
+    or removed since.
+
     Args:
         mounts: Optional list of mount points to search
 
     Returns:
         List of discovered config files
     """
-    home = Path.home()
-    mount_paths = [Path(m) for m in mounts] if mounts else None
+    mount_strs = tuple(os.path.expanduser(m) for m in mounts) if mounts else ()
+    return list(_discover(str(Path.home()), mount_strs))
+
+
+@functools.lru_cache(maxsize=64)
+def _make_location(
+    app_name: str,
+    path_template: str,
+    file_type: FileType,
+    mcp_key: McpKey,
+) -> ConfigLocation:
+    """Return a shared ConfigLocation for these fields, creating it once."""
+    return ConfigLocation(
+        app_name=app_name,
+        path_template=path_template,
+        file_type=file_type,
+        mcp_key=mcp_key,
+    )
 
-    discovered: list[DiscoveredConfig] = []
 
-    for location in KNOWN_LOCATIONS:
-        paths = location.expand_path(home, mount_paths)
-        for path in paths:
-            discovered.append(DiscoveredConfig(location=location, path=path))
+def guess_location(path: str | os.PathLike[str], app_name: str) -> ConfigLocation:
+    """Get a ConfigLocation for a file outside KNOWN_LOCATIONS.
 
-    return discovered
+    The file type and MCP servers key are guessed from the file extension:
+    TOML files use mcp_servers, everything else is JSON with mcpServers.
+
+    Args:
+        path: Path to the config file
+        app_name: Name to report for the file
+
+    Returns:
+        A location with no path template, shared between calls
+    """
+    if os.path.splitext(path)[1].lower() == ".toml":
+        return _make_location(app_name, "", FileType.TOML, McpKey.SNAKE)
+    return _make_location(app_name, "", FileType.JSON, McpKey.CAMEL)
+
+
+def clear_discovery_cache() -> None:
+    """Forget cached discover_configs() results."""
+    _discover.cache_clear()
 
 
 def get_default_source() -> Path | None:
     """Get the default source config file (Claude Desktop)."""
-    home = Path.home()
-    for location in KNOWN_LOCATIONS:
-        if location.app_name == "Claude Desktop":
-            paths = location.expand_path(home)
-            if paths:
-                return paths[0]
-    return None
+    paths = _LOCATIONS_BY_APP["Claude Desktop"].expand_path(Path.home())
+    return paths[0] if paths else None
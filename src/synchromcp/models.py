@@ -1,20 +1,28 @@
-"""Pydantic models for MCP server configurations."""
+"""Data models for MCP server configurations."""
 
 from __future__ import annotations
 
+import copy
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+# McpServer fields whose values are checked to be strings, lists of strings
+# and string-to-string mappings
+_STR_FIELDS = ("command", "url", "cwd", "type", "bearerTokenEnvVar")
+_STR_LIST_FIELDS = ("args", "alwaysAllow")
+_STR_DICT_FIELDS = ("env", "httpHeaders")
 
 
-class McpServer(BaseModel):
+@dataclass(frozen=True, slots=True)
+class McpServer:
     """Model for a single MCP server configuration.
 
     Supports both stdio (command-based) and HTTP (url-based) transports.
+    Keys not covered by the fields below are kept in ``extras``.
     """
 
-    model_config = ConfigDict(extra="allow")
-
     # Stdio transport fields
     command: str | None = None
     args: list[str] | None = None
@@ -38,65 +46,131 @@ class McpServer(BaseModel):
     bearerTokenEnvVar: str | None = None
     httpHeaders: dict[str, str] | None = None
 
-    @model_validator(mode="after")
-    def validate_transport(self) -> McpServer:
-        """Ensure either command or url is provided."""
+    # Unknown keys, preserved as-is
+    extras: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Normalize args, check field types and require command or url.
+
+        Raises:
+            ValueError: If a field has the wrong type or both command and url
+                are missing
+        """
+        # Frozen instances can only be set up through object.__setattr__
+        if isinstance(self.args, str):
+            object.__setattr__(self, "args", [self.args])
+        elif isinstance(self.args, (list, tuple)):
+            object.__setattr__(self, "args", list(self.args))
+
+        for name in _STR_FIELDS:
+            if not isinstance(getattr(self, name), (str, type(None))):
+                msg = f"{name!r} must be a string"
+                raise ValueError(msg)
+        for name in _STR_LIST_FIELDS:
+            value = getattr(self, name)
+            if value is not None and not (
+                isinstance(value, list) and all(isinstance(v, str) for v in value)
+            ):
+                msg = f"{name!r} must be a list of strings"
+                raise ValueError(msg)
+        for name in _STR_DICT_FIELDS:
+            value = getattr(self, name)
+            if value is not None and not (
+                isinstance(value, dict)
+                and all(isinstance(v, str) for v in value.values())
+            ):
+                msg = f"{name!r} must map names to strings"
+                raise ValueError(msg)
+
         if not self.command and not self.url:
             msg = "Either 'command' or 'url' must be provided"
             raise ValueError(msg)
-        return self
 
-    @field_validator("args", mode="before")
     @classmethod
-    def ensure_args_list(cls, v: Any) -> list[str] | None:
-        """Ensure args is a list of strings."""
-        if v is None:
-            return None
-        if isinstance(v, str):
-            return [v]
-        return list(v)
+    def from_dict(cls, data: dict[str, Any]) -> McpServer:
+        """Create from a raw server config, keeping unknown keys in extras."""
+        known = {key: value for key, value in data.items() if key in _FIELDS}
+        extras = {key: value for key, value in data.items() if key not in _FIELDS}
+        return cls(**known, extras=extras)
 
     def is_disabled(self) -> bool:
         """Check if server is disabled (handles both disabled and enabled fields)."""
-        if self.disabled is not None:
-            return self.disabled
-        if self.enabled is not None:
-            return not self.enabled
-        return False
+        # An explicit disabled flag wins over enabled
+        return self.disabled if self.disabled is not None else self.enabled is False
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to raw dict (no None values), including extra keys.
+
+        Lists and dicts are copied, so the result can be modified without
+        changing this server, which may be shared through the read cache.
+        """
+        result: dict[str, Any] = {
+            name: value
+            for name in _FIELD_NAMES
+            if (value := getattr(self, name)) is not None
+        }
+        result.update(
+            (key, value) for key, value in self.extras.items() if value is not None
+        )
+        return copy.deepcopy(result)
 
     def to_toml_dict(self) -> dict[str, Any]:
         """Convert to TOML-compatible dict (snake_case keys, no None values)."""
-        result: dict[str, Any] = {}
-        for key, value in self.model_dump(exclude_none=True).items():
-            # Convert camelCase to snake_case for TOML
-            snake_key = "".join(
-                f"_{c.lower()}" if c.isupper() else c for c in key
-            ).lstrip("_")
-            result[snake_key] = value
-        return result
+        # Field names map through the precomputed table; only extras are scanned
+        return {
+            _SNAKE_KEYS.get(key) or _camel_to_snake(key): value
+            for key, value in self.to_dict().items()
+        }
+
+
+def _camel_to_snake(key: str) -> str:
+    """Convert a camelCase key to snake_case."""
+    return "".join(f"_{c.lower()}" if c.isupper() else c for c in key).lstrip("_")
 
 
-class McpServersConfig(BaseModel):
-    """Container for multiple MCP server configurations."""
+# Config keys that map onto McpServer fields
+_FIELD_NAMES = tuple(f.name for f in fields(McpServer) if f.name != "extras")
+_FIELDS = frozenset(_FIELD_NAMES)
+_SNAKE_KEYS = {name: _camel_to_snake(name) for name in _FIELDS}
 
-    model_config = ConfigDict(extra="forbid")
 
-    servers: dict[str, McpServer]
+@dataclass(frozen=True, slots=True)
+class McpServersConfig:
+    """Container for multiple MCP server configurations.
+
+    ``servers`` is a read-only mapping, since parsed configs are cached and
+    shared between callers.
+    """
+
+    servers: Mapping[str, McpServer]
+
+    def __post_init__(self) -> None:
+        """Store a read-only copy of the servers mapping."""
+        object.__setattr__(self, "servers", MappingProxyType(dict(self.servers)))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> McpServersConfig:
-        """Create from a raw dictionary of server configs."""
-        servers = {
-            name: McpServer.model_validate(config) for name, config in data.items()
-        }
+        """Create from a raw dictionary of server configs.
+
+        Raises:
+            ValueError: If an entry is not a dict or has neither command nor
+                url; the message names the server
+        """
+        servers: dict[str, McpServer] = {}
+        for name, config in data.items():
+            if not isinstance(config, dict):
+                msg = f"Server {name!r} must be an object"
+                raise ValueError(msg)
+            try:
+                servers[name] = McpServer.from_dict(config)
+            except ValueError as e:
+                msg = f"Server {name!r}: {e}"
+                raise ValueError(msg) from e
         return cls(servers=servers)
 
     def to_dict(self) -> dict[str, dict[str, Any]]:
         """Convert to raw dictionary for JSON serialization."""
-        return {
-            name: server.model_dump(exclude_none=True)
-            for name, server in self.servers.items()
-        }
+        return {name: server.to_dict() for name, server in self.servers.items()}
 
     def to_toml_dict(self) -> dict[str, dict[str, Any]]:
         """Convert to TOML-compatible dictionary."""
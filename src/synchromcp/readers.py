@@ -2,32 +2,35 @@
 
 from __future__ import annotations
 
-import json
-import tomllib
+import functools
+import os
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Any
 
+from synchromcp._compat import json_load_section, json_loads
 from synchromcp.config import ConfigLocation, FileType, McpKey
 from synchromcp.models import McpServersConfig
 
 
 def read_json(path: Path) -> dict[str, Any]:
     """Read a JSON file and return its contents."""
-    with path.open("r", encoding="utf-8") as f:
-        result: dict[str, Any] = json.load(f)
-        return result
+    result: dict[str, Any] = json_loads(path.read_bytes())
+    return result
 
 
 def read_toml(path: Path) -> dict[str, Any]:
     """Read a TOML file and return its contents."""
-    with path.open("rb") as f:
-        return tomllib.load(f)
+    import tomllib  # Only loaded once a TOML config is actually read
+
+    # Read in one call and parse from memory, like read_json
+    return tomllib.loads(path.read_bytes().decode("utf-8"))
 
 
 def extract_mcp_servers(
     data: dict[str, Any],
     mcp_key: McpKey,
-    nested_path: list[str] | None = None,
+    nested_path: Sequence[str] | None = None,
 ) -> dict[str, Any] | None:
     """Extract the mcpServers/mcp_servers section from config data.
 
@@ -39,54 +42,166 @@ def extract_mcp_servers(
     Returns:
         The MCP servers dict, or None if key not found
     """
-    key = mcp_key.value
-
-    if nested_path:
-        # Navigate to nested location
-        current = data
-        for segment in nested_path:
-            if isinstance(current, dict) and segment in current:
-                current = current[segment]
-            else:
-                return None
-        if isinstance(current, dict) and key in current:
-            result: dict[str, Any] = current[key]
-            return result
-        return None
+    getter = _make_getter((*(nested_path or ()), mcp_key))
+    result: dict[str, Any] | None = getter(data)
+    return result
+
+
+@functools.cache
+def _make_getter(keys: tuple[str, ...]) -> Callable[[Any], Any]:
+    """Build a function returning the value at a key path in nested dicts.
+
+    The function returns None if a key is missing or a value along the path
+    is not a dict. One getter is built per distinct path and reused.
+    """
+    if not keys:
+        return lambda value: value
+
+    head = keys[0]
+    get_inner = _make_getter(keys[1:])
+
+    def getter(data: Any) -> Any:
+        return get_inner(data.get(head)) if isinstance(data, dict) else None
 
-    # Look for key at top level
-    if key in data:
-        result = data[key]
-        return result
-    return None
+    return getter
 
 
 def read_config(
     path: Path,
     location: ConfigLocation,
+    *,
+    cache: bool = False,
+    validate: bool = True,
 ) -> tuple[dict[str, Any], McpServersConfig | None]:
     """Read a config file and extract MCP servers.
 
+    By default the file is parsed on every call and the returned data is
+    owned by the caller.
+
     Args:
         path: Path to the config file
         location: ConfigLocation with file type and key info
+        cache: If True, cache results by path, modification time, size and
+            inode, so an unchanged file is parsed only once per process; the
+            returned data is then shared and must not be modified in place
+        validate: If False, skip building McpServersConfig from the servers
+            section and return None in its place; for callers that only
+            need the raw data
 
     Returns:
         Tuple of (full_data, parsed_mcp_servers or None if invalid/empty)
     """
-    if location.file_type == FileType.JSON:
+    nested_path = location.nested_path or ()
+    if not cache:
+        return _parse_config(
+            path, location.file_type, location.mcp_key, nested_path, validate
+        )
+
+    stat = os.stat(path)
+    return _read_config_cached(
+        os.fspath(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        stat.st_ino,
+        location.file_type,
+        location.mcp_key,
+        nested_path,
+        validate,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _read_config_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    inode: int,
+    file_type: FileType,
+    mcp_key: McpKey,
+    nested_path: tuple[str, ...],
+    validate: bool,
+) -> tuple[dict[str, Any], McpServersConfig | None]:
+    """Parse a config file; the stat fields only serve as cache key."""
+    return _parse_config(Path(path), file_type, mcp_key, nested_path, validate)
+
+
+def _parse_config(
+    path: Path,
+    file_type: FileType,
+    mcp_key: McpKey,
+    nested_path: tuple[str, ...],
+    validate: bool,
+) -> tuple[dict[str, Any], McpServersConfig | None]:
+    """Parse a config file and, if validate is set, its MCP servers section."""
+    if file_type == FileType.JSON:
         data = read_json(path)
     else:
         data = read_toml(path)
 
-    mcp_data = extract_mcp_servers(data, location.mcp_key, location.nested_path)
+    if not validate:
+        return data, None
+
+    mcp_data = extract_mcp_servers(data, mcp_key, nested_path)
+    return data, _parse_servers(mcp_data)
+
 
+def read_mcp_servers(
+    path: Path,
+    location: ConfigLocation,
+) -> McpServersConfig | None:
+    """Read only the MCP servers section of a config file.
+
+    Use this instead of read_config when the rest of the file is not
+    needed: with simdjson installed, JSON files are navigated lazily and
+    only the MCP servers subtree is converted to Python objects.
+
+    Results are cached by path, modification time, size and inode, so the
+    returned config is shared between callers and must not be modified.
+
+    Args:
+        path: Path to the config file
+        location: ConfigLocation with file type and key info
+
+    Returns:
+        Parsed MCP servers, or None if invalid/empty
+    """
+    stat = os.stat(path)
+    return _read_mcp_servers_cached(
+        os.fspath(path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        stat.st_ino,
+        location.file_type,
+        location.mcp_key,
+        location.nested_path or (),
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _read_mcp_servers_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    inode: int,
+    file_type: FileType,
+    mcp_key: McpKey,
+    nested_path: tuple[str, ...],
+) -> McpServersConfig | None:
+    """Parse a servers section; the stat fields only serve as cache key."""
+    if file_type == FileType.JSON:
+        mcp_data = json_load_section(Path(path).read_bytes(), (*nested_path, mcp_key))
+    else:
+        mcp_data = extract_mcp_servers(read_toml(Path(path)), mcp_key, nested_path)
+    return _parse_servers(mcp_data)
+
+
+def _parse_servers(mcp_data: Any) -> McpServersConfig | None:
+    """Validate a raw MCP servers section, returning None if missing/invalid."""
     if mcp_data is None:
-        return data, None
+        return None
 
     try:
-        config = McpServersConfig.from_dict(mcp_data)
-        return data, config
+        return McpServersConfig.from_dict(mcp_data)
     except Exception:
         # Invalid config, return None
-        return data, None
+        return None
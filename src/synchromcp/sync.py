@@ -2,22 +2,27 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-
-from loguru import logger
+from typing import Any
 
 from synchromcp.config import (
-    ConfigLocation,
     DiscoveredConfig,
-    FileType,
     McpKey,
     discover_configs,
     get_default_source,
+    guess_location,
 )
 from synchromcp.models import McpServersConfig
-from synchromcp.readers import read_config
-from synchromcp.writers import write_config
+from synchromcp.readers import extract_mcp_servers, read_config, read_mcp_servers
+from synchromcp.writers import convert_servers, write_config
+
+# Upper bound on concurrent target reads/writes; configs are small local
+# files, so more threads mostly add start-up cost
+_MAX_WORKERS = 8
 
 
 @dataclass
@@ -29,6 +34,7 @@ class SyncResult:
     success: bool
     message: str
     servers_count: int = 0
+    skipped: bool = False  # True if the target already matched the source
 
 
 def load_source(source_path: Path | None = None) -> tuple[Path, McpServersConfig]:
@@ -44,38 +50,145 @@ def load_source(source_path: Path | None = None) -> tuple[Path, McpServersConfig
         FileNotFoundError: If source file doesn't exist
         ValueError: If source has no valid MCP servers
     """
+    source_path = _resolve_source(source_path)
+    try:
+        config = read_mcp_servers(source_path, guess_location(source_path, "Source"))
+    except FileNotFoundError:
+        msg = f"Source file not found: {source_path}"
+        raise FileNotFoundError(msg) from None
+    if config is None:
+        msg = f"No valid MCP servers found in source: {source_path}"
+        raise ValueError(msg)
+
+    return source_path, config
+
+
+def load_source_servers(
+    source_path: Path | None = None,
+) -> tuple[Path, dict[str, Any]]:
+    """Load the raw MCP servers section from source config, as stored.
+
+    The servers are not validated, so nothing is built for callers that
+    only display them.
+
+    Args:
+        source_path: Optional explicit source path. If None, uses default.
+
+    Returns:
+        Tuple of (source_path, servers)
+
+    Raises:
+        FileNotFoundError: If source file doesn't exist
+        ValueError: If source has no MCP servers section
+    """
+    source_path = _resolve_source(source_path)
+    location = guess_location(source_path, "Source")
+    try:
+        data, _ = read_config(source_path, location, validate=False)
+    except FileNotFoundError:
+        msg = f"Source file not found: {source_path}"
+        raise FileNotFoundError(msg) from None
+    servers = extract_mcp_servers(data, location.mcp_key, location.nested_path)
+    if not isinstance(servers, dict):
+        msg = f"No MCP servers found in source: {source_path}"
+        raise ValueError(msg)
+
+    return source_path, servers
+
+
+def _resolve_source(source_path: Path | None) -> Path:
+    """Return source_path, or the default source if it is None."""
     if source_path is None:
         source_path = get_default_source()
         if source_path is None:
             msg = "No default source found (Claude Desktop config)"
             raise FileNotFoundError(msg)
+    return source_path
 
-    if not source_path.exists():
-        msg = f"Source file not found: {source_path}"
-        raise FileNotFoundError(msg)
 
-    # Determine file type from extension
-    if source_path.suffix.lower() == ".toml":
-        file_type = FileType.TOML
-        mcp_key = McpKey.SNAKE
-    else:
-        file_type = FileType.JSON
-        mcp_key = McpKey.CAMEL
-
-    # Create a temporary location for reading
-    temp_location = ConfigLocation(
-        app_name="Source",
-        path_template="",
-        file_type=file_type,
-        mcp_key=mcp_key,
+def _plan_target(target: DiscoveredConfig, servers_count: int) -> SyncResult:
+    """Report what syncing would do to a target, without reading it.
+
+    Args:
+        target: The target config file
+        servers_count: Number of servers that would be written
+
+    Returns:
+        The dry-run result for this target
+    """
+    if not os.path.exists(target.path):
+        return SyncResult(
+            path=target.path,
+            app_name=target.location.app_name,
+            success=False,
+            message="File not found",
+        )
+    return SyncResult(
+        path=target.path,
+        app_name=target.location.app_name,
+        success=True,
+        message="Would update (dry run)",
+        servers_count=servers_count,
     )
 
-    _, config = read_config(source_path, temp_location)
-    if config is None:
-        msg = f"No valid MCP servers found in source: {source_path}"
-        raise ValueError(msg)
 
-    return source_path, config
+def _sync_one_target(
+    target: DiscoveredConfig,
+    serialized: dict[McpKey, dict[str, Any]],
+) -> SyncResult:
+    """Sync the source config to a single target.
+
+    Args:
+        target: The target config file
+        serialized: The source servers converted for each McpKey (not modified)
+
+    Returns:
+        The sync result for this target
+    """
+    from loguru import logger  # Deferred so importing synchromcp stays cheap
+
+    servers = serialized[target.location.mcp_key]
+    try:
+        # Read existing data; an uncached read is ours to update in place, and
+        # the target's own servers are replaced, so they are not validated
+        data, _ = read_config(target.path, target.location, validate=False)
+        written = write_config(
+            target.path, data, servers, target.location, inplace=True
+        )
+        if written:
+            logger.info(f"Updated {target.path}")
+        return SyncResult(
+            path=target.path,
+            app_name=target.location.app_name,
+            success=True,
+            message="Updated" if written else "Already up to date",
+            servers_count=len(servers),
+            skipped=not written,
+        )
+
+    except FileNotFoundError:
+        return SyncResult(
+            path=target.path,
+            app_name=target.location.app_name,
+            success=False,
+            message="File not found",
+        )
+    except PermissionError:
+        logger.warning(f"Permission denied: {target.path}")
+        return SyncResult(
+            path=target.path,
+            app_name=target.location.app_name,
+            success=False,
+            message="Permission denied",
+        )
+    except Exception as e:
+        logger.error(f"Error updating {target.path}: {e}")
+        return SyncResult(
+            path=target.path,
+            app_name=target.location.app_name,
+            success=False,
+            message=str(e),
+        )
 
 
 def sync_configs(
@@ -93,110 +206,105 @@ def sync_configs(
         dry_run: If True, don't write changes.
 
     Returns:
-        List of sync results
+        List of sync results, in target order
     """
-    results: list[SyncResult] = []
+    return list(_sync_results(source_path, target_paths, mounts, dry_run, ordered=True))
+
+
+def sync_configs_stream(
+    source_path: Path | None = None,
+    target_paths: list[str] | None = None,
+    mounts: list[str] | None = None,
+    dry_run: bool = False,
+) -> Iterator[SyncResult]:
+    """Sync MCP configurations from source to targets, yielding each result.
+
+    Results are yielded as soon as each target is done, so callers can
+    report progress without waiting for the slowest target. Closing the
+    iterator early cancels targets that have not started yet.
+
+    Args:
+        source_path: Path to source config. If None, uses Claude Desktop.
+        target_paths: Optional list of specific target paths.
+        mounts: Optional list of mount points for external volumes.
+        dry_run: If True, don't write changes.
+
+    Yields:
+        Sync results, in the order the targets finished
+    """
+    return _sync_results(source_path, target_paths, mounts, dry_run, ordered=False)
+
+
+def _sync_results(
+    source_path: Path | None,
+    target_paths: list[str] | None,
+    mounts: list[str] | None,
+    dry_run: bool,
+    ordered: bool,
+) -> Iterator[SyncResult]:
+    """Sync to each target, yielding in target order or as targets finish."""
+    from loguru import logger
 
     # Load source
     try:
         source, config = load_source(source_path)
         logger.info(f"Loaded {len(config.servers)} servers from {source}")
     except (FileNotFoundError, ValueError) as e:
-        return [
-            SyncResult(
-                path=source_path or Path("unknown"),
-                app_name="Source",
-                success=False,
-                message=str(e),
-            )
-        ]
+        yield SyncResult(
+            path=source_path or Path("unknown"),
+            app_name="Source",
+            success=False,
+            message=str(e),
+        )
+        return
 
     # Discover targets
     if target_paths:
-        # Use explicit targets
+        # Use explicit targets; paths stay strings until they are stored
         discovered: list[DiscoveredConfig] = []
         for target_str in target_paths:
-            target_path = Path(target_str)
-            if target_path.exists():
-                # Guess file type and key
-                if target_path.suffix.lower() == ".toml":
-                    file_type = FileType.TOML
-                    mcp_key = McpKey.SNAKE
-                else:
-                    file_type = FileType.JSON
-                    mcp_key = McpKey.CAMEL
-
-                location = ConfigLocation(
-                    app_name=target_path.name,
-                    path_template="",
-                    file_type=file_type,
-                    mcp_key=mcp_key,
-                )
-                discovered.append(DiscoveredConfig(location=location, path=target_path))
-            else:
-                results.append(
-                    SyncResult(
-                        path=target_path,
-                        app_name=target_path.name,
-                        success=False,
-                        message="File not found",
-                    )
-                )
+            location = guess_location(target_str, os.path.basename(target_str))
+            discovered.append(
+                DiscoveredConfig(location=location, path=Path(target_str))
+            )
     else:
         # Discover all targets
         discovered = discover_configs(mounts)
 
-    # Filter out source from targets
-    discovered = [t for t in discovered if t.path.resolve() != source.resolve()]
-
-    # Sync to each target
+    # Filter out the source and duplicate targets (e.g. the same file
+    # reachable through two mount points), resolving each path only once
+    seen = {os.path.realpath(source)}
+    targets: list[DiscoveredConfig] = []
     for target in discovered:
-        try:
-            # Read existing data
-            data, _ = read_config(target.path, target.location)
-
-            if dry_run:
-                results.append(
-                    SyncResult(
-                        path=target.path,
-                        app_name=target.location.app_name,
-                        success=True,
-                        message="Would update (dry run)",
-                        servers_count=len(config.servers),
-                    )
-                )
-            else:
-                write_config(target.path, data, config, target.location)
-                results.append(
-                    SyncResult(
-                        path=target.path,
-                        app_name=target.location.app_name,
-                        success=True,
-                        message="Updated",
-                        servers_count=len(config.servers),
-                    )
-                )
-                logger.info(f"Updated {target.path}")
-
-        except PermissionError:
-            results.append(
-                SyncResult(
-                    path=target.path,
-                    app_name=target.location.app_name,
-                    success=False,
-                    message="Permission denied",
-                )
-            )
-            logger.warning(f"Permission denied: {target.path}")
-        except Exception as e:
-            results.append(
-                SyncResult(
-                    path=target.path,
-                    app_name=target.location.app_name,
-                    success=False,
-                    message=str(e),
-                )
-            )
-            logger.error(f"Error updating {target.path}: {e}")
+        resolved = os.path.realpath(target.path)
+        if resolved not in seen:
+            seen.add(resolved)
+            targets.append(target)
+
+    # A dry run only checks that each target exists, which needs neither the
+    # converted servers nor a thread pool
+    if dry_run:
+        for target in targets:
+            yield _plan_target(target, len(config.servers))
+        return
+
+    # Convert the servers once per key format rather than once per target
+    serialized = {key: convert_servers(config, key) for key in McpKey}
 
-    return results
+    # Sync to each target; targets are independent, I/O-bound files.
+    # A lone target is synced directly, without starting a thread pool
+    if len(targets) == 1:
+        yield _sync_one_target(targets[0], serialized)
+    elif targets:
+        workers = min(_MAX_WORKERS, len(targets))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_sync_one_target, target, serialized)
+                for target in targets
+            ]
+            try:
+                for future in futures if ordered else as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
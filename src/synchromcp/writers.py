@@ -2,96 +2,237 @@
 
 from __future__ import annotations
 
-import json
+import contextlib
+import functools
+import os
+import secrets
+import stat
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from typing import Any
 
-import tomli_w
-
+from synchromcp._compat import json_dumps, toml_dumps
 from synchromcp.config import ConfigLocation, FileType, McpKey
 from synchromcp.models import McpServersConfig
+from synchromcp.readers import extract_mcp_servers
+
+# O_EXCL makes creation fail instead of following a file or symlink planted
+# at the temporary name; O_BINARY only exists (and matters) on Windows
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+# Only root can keep the owner of files it rewrites; geteuid is POSIX-only
+_IS_ROOT = hasattr(os, "geteuid") and os.geteuid() == 0
+
+
+def _atomic_write(path: Path, payload: bytes) -> None:
+    """Write a file through a temporary sibling and an atomic rename.
+
+    A crash mid-write leaves the original file intact. Symlinks are followed
+    so the link itself survives, and an existing file's permissions are kept;
+    the temporary file is created with them, so a private config is never
+    readable by others even while it is being written. When running as root
+    (e.g. syncing other users' homes through --mounts), the owner and group
+    are kept too.
+
+    The rename replaces the file's inode, so a hard link to the old file
+    keeps the old contents instead of seeing the update.
+
+    Args:
+        path: File to write
+        payload: The complete new contents
+    """
+    target = os.path.realpath(path)
+    directory, name = os.path.split(target)
+    tmp = os.path.join(directory, f".{name}.{secrets.token_hex(8)}.tmp")
+    try:
+        existing: os.stat_result | None = os.stat(target)
+    except FileNotFoundError:
+        existing = None
+    mode = None if existing is None else stat.S_IMODE(existing.st_mode)
+
+    fd = os.open(tmp, _OPEN_FLAGS, 0o666 if mode is None else mode)
+    try:
+        try:
+            # Unbuffered writes; os.write may write less than it is given
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view) :]
+            if existing is not None and _IS_ROOT:
+                # Only root can give the file back to its owner; done before
+                # fchmod, as changing the owner may clear setuid/setgid bits
+                os.fchown(fd, existing.st_uid, existing.st_gid)
+            if mode is not None and hasattr(os, "fchmod"):
+                # Restore any bits the umask removed when the file was created
+                os.fchmod(fd, mode)
+        finally:
+            os.close(fd)
+        os.replace(tmp, target)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
 
 
 def write_json(path: Path, data: dict[str, Any]) -> None:
     """Write data to a JSON file with pretty formatting."""
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    # Serialized in one pass and written with a single write call
+    _atomic_write(path, json_dumps(data))
 
 
 def write_toml(path: Path, data: dict[str, Any]) -> None:
     """Write data to a TOML file."""
-    with path.open("wb") as f:
-        tomli_w.dump(data, f)
+    _atomic_write(path, toml_dumps(data))
+
+
+# Dispatch tables keyed by the location's enums
+_CONVERTERS: dict[McpKey, Callable[[McpServersConfig], dict[str, Any]]] = {
+    McpKey.CAMEL: McpServersConfig.to_dict,
+    McpKey.SNAKE: McpServersConfig.to_toml_dict,
+}
+_WRITERS: dict[FileType, Callable[[Path, dict[str, Any]], None]] = {
+    FileType.JSON: write_json,
+    FileType.TOML: write_toml,
+}
+
+
+def convert_servers(mcp_config: McpServersConfig, mcp_key: McpKey) -> dict[str, Any]:
+    """Convert servers to the dict format stored under mcp_key.
+
+    Args:
+        mcp_config: The MCP servers configuration
+        mcp_key: The key name the servers are written under
+
+    Returns:
+        camelCase server dicts for mcpServers, snake_case for mcp_servers
+    """
+    return _CONVERTERS[mcp_key](mcp_config)
+
+
+_Setter = Callable[[dict[str, Any], Any], dict[str, Any]]
+
+
+def _nested_dict(data: dict[str, Any], segment: str) -> dict[str, Any]:
+    """Return the dict stored at segment, or a new one if it is missing.
+
+    Raises:
+        TypeError: If segment holds something other than a dict, which must
+            not be overwritten
+    """
+    if segment not in data:
+        return {}
+    child = data[segment]
+    if not isinstance(child, dict):
+        msg = f"Expected an object at {segment!r}, found {type(child).__name__}"
+        raise TypeError(msg)
+    return child
+
+
+@functools.cache
+def _make_setter(nested_path: tuple[str, ...], key: str) -> _Setter:
+    """Build a function that sets key below nested_path in a copy of the data.
+
+    Only the dicts along the path are copied; untouched siblings stay shared.
+    One setter is built per distinct path and reused for every file.
+
+    Args:
+        nested_path: Keys leading to the dict that holds key
+        key: The key to set
+
+    Returns:
+        A function taking (data, value) and returning the updated copy
+    """
+    if not nested_path:
+        return lambda data, value: {**data, key: value}
+
+    head = nested_path[0]
+    set_inner = _make_setter(nested_path[1:], key)
+
+    def setter(data: dict[str, Any], value: Any) -> dict[str, Any]:
+        return {**data, head: set_inner(_nested_dict(data, head), value)}
+
+    return setter
 
 
 def update_mcp_servers(
     data: dict[str, Any],
-    mcp_config: McpServersConfig,
+    mcp_config: McpServersConfig | dict[str, Any],
     mcp_key: McpKey,
-    nested_path: list[str] | None = None,
+    nested_path: Sequence[str] | None = None,
+    inplace: bool = False,
 ) -> dict[str, Any]:
     """Update the mcpServers section in config data, preserving other data.
 
     Args:
         data: The full config data
-        mcp_config: The new MCP servers configuration
+        mcp_config: The new MCP servers configuration, or the result of
+            convert_servers() for mcp_key when writing the same servers to
+            several files
         mcp_key: The key name to use (mcpServers or mcp_servers)
         nested_path: Optional path to nested location
+        inplace: If True, modify data itself instead of returning a copy;
+            only for callers that own data exclusively
 
     Returns:
         Updated config data with new MCP servers
-    """
-    key = mcp_key.value
-    result = data.copy()
 
-    # Convert config to appropriate format
-    if mcp_key == McpKey.SNAKE:
-        new_servers = mcp_config.to_toml_dict()
-    else:
-        new_servers = mcp_config.to_dict()
-
-    if nested_path:
-        # Navigate to nested location and update
-        current = result
-        for segment in nested_path[:-1]:
-            if segment not in current:
-                current[segment] = {}
-            current = current[segment]
-
-        last_segment = nested_path[-1]
-        if last_segment not in current:
-            current[last_segment] = {}
-        current[last_segment][key] = new_servers
+    Raises:
+        TypeError: If a value along nested_path exists but is not a dict
+    """
+    if isinstance(mcp_config, McpServersConfig):
+        new_servers = convert_servers(mcp_config, mcp_key)
     else:
-        # Update at top level
-        result[key] = new_servers
+        new_servers = mcp_config
 
-    return result
+    if inplace:
+        current = data
+        for segment in nested_path or ():
+            child = current[segment] = _nested_dict(current, segment)
+            current = child
+        current[mcp_key] = new_servers
+        return data
+
+    setter = _make_setter(tuple(nested_path or ()), mcp_key)
+    return setter(data, new_servers)
 
 
 def write_config(
     path: Path,
     data: dict[str, Any],
-    mcp_config: McpServersConfig,
+    mcp_config: McpServersConfig | dict[str, Any],
     location: ConfigLocation,
-) -> None:
+    inplace: bool = False,
+) -> bool:
     """Write config to file, updating only the MCP servers section.
 
+    The file is left untouched if it already contains exactly these servers.
+
     Args:
         path: Path to the config file
         data: The full config data (to preserve other sections)
-        mcp_config: The new MCP servers configuration
+        mcp_config: The new MCP servers configuration, or the result of
+            convert_servers() for location.mcp_key
         location: ConfigLocation with file type and key info
+        inplace: If True, update data in place rather than a copy of it
+
+    Returns:
+        True if the file was written, False if it was already up to date
     """
+    if isinstance(mcp_config, McpServersConfig):
+        new_servers = convert_servers(mcp_config, location.mcp_key)
+    else:
+        new_servers = mcp_config
+
+    existing = extract_mcp_servers(data, location.mcp_key, location.nested_path)
+    if existing == new_servers:
+        return False
+
     updated = update_mcp_servers(
         data,
-        mcp_config,
+        new_servers,
         location.mcp_key,
         location.nested_path,
+        inplace=inplace,
     )
 
-    if location.file_type == FileType.JSON:
-        write_json(path, updated)
-    else:
-        write_toml(path, updated)
+    _WRITERS[location.file_type](path, updated)
+    return True
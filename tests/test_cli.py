@@ -1,7 +1,10 @@
 """Tests for CLI interface."""
 
+import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from synchromcp.cli import SynchroCLI
 
 
@@ -45,20 +48,30 @@ class TestSynchroCLI:
 
         cli = SynchroCLI()
 
-        with patch('synchromcp.cli.load_source') as mock_load_source, \
+        with patch('synchromcp.cli.load_source_servers') as mock_load_source, \
              patch('synchromcp.cli.console.print'):
 
-            # Mock real server objects properly
-            from synchromcp.models import McpServer, McpServersConfig
-            mock_config = McpServersConfig(servers={
-                "server1": McpServer(command="npx", args=["-y", "pkg"])
-            })
-            mock_load_source.return_value = (config_file, mock_config)
+            mock_servers = {"server1": {"command": "npx", "args": ["-y", "pkg"]}}
+            mock_load_source.return_value = (config_file, mock_servers)
 
             cli.show(str(config_file))
 
             mock_load_source.assert_called_once_with(config_file)
 
+    def test_show_validate_rejects_invalid_server(self, tmp_path):
+        """Test that show prints servers as stored unless --validate is given."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"mcpServers": {"bad": {"env": {}}}}))
+
+        cli = SynchroCLI()
+
+        with patch('synchromcp.cli.console.print'):
+            cli.show(str(config_file))
+
+            with pytest.raises(SystemExit) as exc_info:
+                cli.show(str(config_file), validate=True)
+            assert exc_info.value.code == 1
+
     def test_sync_basic(self, tmp_path):
         """Test basic sync command."""
         source = tmp_path / "source.json"
@@ -6,13 +6,38 @@ from synchromcp.config import (
     ConfigLocation,
     FileType,
     McpKey,
+    clear_discovery_cache,
     discover_configs,
+    guess_location,
 )
 
 
 class TestConfigLocation:
     """Tests for ConfigLocation."""
 
+    def test_nested_path_stored_as_tuple(self):
+        """Test that locations are hashable even when given a list path."""
+        location = ConfigLocation(
+            app_name="Test",
+            path_template="{home}/settings.json",
+            file_type=FileType.JSON,
+            mcp_key=McpKey.CAMEL,
+            nested_path=["mcp", "servers"],
+        )
+        assert location.nested_path == ("mcp", "servers")
+        assert hash(location) == hash(location)
+
+    def test_guess_location_from_suffix(self, tmp_path):
+        """Test that file type and key follow the extension, sharing instances."""
+        toml_location = guess_location(tmp_path / "config.toml", "Test")
+        assert toml_location.file_type == FileType.TOML
+        assert toml_location.mcp_key == McpKey.SNAKE
+
+        json_location = guess_location(tmp_path / "a.json", "Test")
+        assert json_location.file_type == FileType.JSON
+        assert json_location.mcp_key == McpKey.CAMEL
+        assert guess_location(tmp_path / "b.json", "Test") is json_location
+
     def test_expand_home_path(self, tmp_path):
         """Test expanding home directory paths."""
         # Create a test config file
@@ -94,3 +119,45 @@ class TestDiscoverConfigs:
         # Should find at least the one we created
         cursor_configs = [c for c in configs if c.location.app_name == "Cursor"]
         assert any(c.path == config1 for c in cursor_configs)
+
+    def test_discover_nested_config_in_mount(self, tmp_path):
+        """Test discovery of a config nested several directories below a mount."""
+        mount = tmp_path / "mount"
+        config = mount / ".gemini" / "antigravity" / "mcp_config.json"
+        config.parent.mkdir(parents=True)
+        config.write_text('{"mcpServers": {}}')
+        # Sibling template under the same parent must not match
+        (mount / ".gemini" / "unrelated.json").write_text("{}")
+
+        configs = discover_configs(mounts=[str(mount)])
+        found = {c.location.app_name for c in configs if c.path.is_relative_to(mount)}
+        assert found == {"Gemini Antigravity"}
+
+    def test_discover_ignores_directories_named_like_configs(self, tmp_path):
+        """Test that only files, not directories, are reported as configs."""
+        mount = tmp_path / "mount"
+        (mount / ".cursor" / "mcp.json").mkdir(parents=True)
+
+        configs = discover_configs(mounts=[str(mount)])
+        assert not [c for c in configs if c.path.is_relative_to(mount)]
+
+    def test_discover_cache_cleared(self, tmp_path):
+        """Test that discovery results are cached until the cache is cleared."""
+        mount = tmp_path / "mount"
+        mount.mkdir()
+        assert not [
+            c
+            for c in discover_configs(mounts=[str(mount)])
+            if c.path.is_relative_to(mount)
+        ]
+
+        config = mount / ".cursor" / "mcp.json"
+        config.parent.mkdir()
+        config.write_text('{"mcpServers": {}}')
+
+        configs = discover_configs(mounts=[str(mount)])
+        assert not any(c.path == config for c in configs)
+
+        clear_discovery_cache()
+        configs = discover_configs(mounts=[str(mount)])
+        assert any(c.path == config for c in configs)
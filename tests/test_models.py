@@ -1,7 +1,6 @@
-"""Tests for Pydantic models."""
+"""Tests for data models."""
 
 import pytest
-from pydantic import ValidationError
 
 from synchromcp.models import McpServer, McpServersConfig
 
@@ -24,9 +23,22 @@ class TestMcpServer:
 
     def test_requires_command_or_url(self):
         """Test that either command or url is required."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValueError):
             McpServer()
 
+    @pytest.mark.parametrize(
+        ("data", "message"),
+        [
+            ({"command": ["npx"]}, "'command' must be a string"),
+            ({"command": "npx", "args": [1, 2]}, "'args' must be a list of strings"),
+            ({"command": "npx", "env": {"A": 1}}, "'env' must map names to strings"),
+        ],
+    )
+    def test_rejects_wrong_types(self, data, message):
+        """Test that fields holding the wrong type are rejected."""
+        with pytest.raises(ValueError, match=message):
+            McpServer.from_dict(data)
+
     def test_with_env(self):
         """Test server with environment variables."""
         server = McpServer(
@@ -52,16 +64,31 @@ class TestMcpServer:
         server = McpServer(command="test", enabled=True)
         assert server.is_disabled() is False
 
+    def test_disabled_takes_precedence_over_enabled(self):
+        """Test that an explicit disabled flag overrides enabled."""
+        server = McpServer(command="test", disabled=False, enabled=False)
+        assert server.is_disabled() is False
+
+        server = McpServer(command="test", disabled=True, enabled=True)
+        assert server.is_disabled() is True
+
     def test_extra_fields_allowed(self):
         """Test that extra fields are preserved."""
-        server = McpServer(command="test", customField="value")
-        assert server.model_extra.get("customField") == "value"
+        server = McpServer.from_dict({"command": "test", "customField": "value"})
+        assert server.extras.get("customField") == "value"
+        assert server.to_dict()["customField"] == "value"
 
     def test_args_string_to_list(self):
         """Test that string args are converted to list."""
         server = McpServer(command="test", args="single-arg")
         assert server.args == ["single-arg"]
 
+    def test_frozen(self):
+        """Test that servers cannot be modified after creation."""
+        server = McpServer(command="test")
+        with pytest.raises(AttributeError):
+            server.command = "other"
+
     def test_to_toml_dict(self):
         """Test conversion to TOML-compatible dict."""
         server = McpServer(
@@ -111,6 +138,35 @@ class TestMcpServersConfig:
         assert "server1" in result
         assert "always_allow" in result["server1"]
 
+    def test_frozen(self):
+        """Test that the servers mapping cannot be replaced."""
+        config = McpServersConfig.from_dict({"server1": {"command": "test"}})
+        with pytest.raises(AttributeError):
+            config.servers = {}
+
+    def test_servers_read_only(self):
+        """Test that the shared servers mapping cannot be modified in place."""
+        servers = {"server1": McpServer(command="test")}
+        config = McpServersConfig(servers=servers)
+        with pytest.raises(TypeError):
+            config.servers["server2"] = McpServer(command="other")
+        servers.clear()
+        assert "server1" in config.servers
+
+    def test_from_dict_rejects_invalid_server(self):
+        """Test that one invalid entry rejects the config, naming the server."""
+        with pytest.raises(ValueError, match="'broken': Either 'command' or 'url'"):
+            McpServersConfig.from_dict(
+                {
+                    "ok": {"command": "test"},
+                    "broken": {"env": {"KEY": "value"}},
+                }
+            )
+        with pytest.raises(ValueError, match="'broken': 'command' must be a string"):
+            McpServersConfig.from_dict({"broken": {"command": 1}})
+        with pytest.raises(ValueError, match="'not_a_dict'"):
+            McpServersConfig.from_dict({"not_a_dict": "npx"})
+
     def test_empty_config(self):
         """Test creating empty config."""
         config = McpServersConfig.from_dict({})
@@ -7,6 +7,7 @@ from synchromcp.readers import (
     extract_mcp_servers,
     read_config,
     read_json,
+    read_mcp_servers,
 )
 
 
@@ -64,6 +65,12 @@ class TestExtractMcpServers:
         result = extract_mcp_servers(data, McpKey.CAMEL, ["mcp", "config"])
         assert "server1" in result
 
+    def test_extract_nested_path_through_non_dict(self):
+        """Test that a non-dict value along the nested path yields None."""
+        data = {"mcp": {"config": ["not", "a", "dict"]}}
+        assert extract_mcp_servers(data, McpKey.CAMEL, ["mcp", "config"]) is None
+        assert extract_mcp_servers(data, McpKey.CAMEL, ["missing"]) is None
+
 
 class TestReadConfig:
     """Tests for full config reading."""
@@ -136,3 +143,109 @@ class TestReadConfig:
 
         _, config = read_config(config_file, location)
         assert config is None
+
+    def test_read_config_cached_until_file_changes(self, tmp_path):
+        """Test that unchanged files are parsed once and changes are picked up."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"mcpServers": {}}))
+
+        location = ConfigLocation(
+            app_name="Test",
+            path_template="",
+            file_type=FileType.JSON,
+            mcp_key=McpKey.CAMEL,
+        )
+
+        first, _ = read_config(config_file, location, cache=True)
+        assert read_config(config_file, location, cache=True)[0] is first
+
+        config_file.write_text(json.dumps({"mcpServers": {}, "theme": "dark"}))
+        second, _ = read_config(config_file, location, cache=True)
+        assert second["theme"] == "dark"
+
+    def test_read_config_uncached(self, tmp_path):
+        """Test that uncached reads, the default, return fresh data each time."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"mcpServers": {}}))
+
+        location = ConfigLocation(
+            app_name="Test",
+            path_template="",
+            file_type=FileType.JSON,
+            mcp_key=McpKey.CAMEL,
+        )
+
+        cached, _ = read_config(config_file, location, cache=True)
+        first, _ = read_config(config_file, location)
+        first["theme"] = "mutated"
+        second, _ = read_config(config_file, location)
+
+        assert second == cached
+        assert "theme" not in second
+        assert first is not second
+
+    def test_read_config_without_validation(self, tmp_path):
+        """Test that validate=False returns the data without parsing servers."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(
+            json.dumps(
+                {
+                    "mcpServers": {"bad": {"args": ["no command or url"]}},
+                }
+            )
+        )
+
+        location = ConfigLocation(
+            app_name="Test",
+            path_template="",
+            file_type=FileType.JSON,
+            mcp_key=McpKey.CAMEL,
+        )
+
+        data, config = read_config(config_file, location, validate=False)
+
+        assert config is None
+        assert data["mcpServers"]["bad"] == {"args": ["no command or url"]}
+
+
+class TestReadMcpServers:
+    """Tests for reading only the MCP servers section."""
+
+    def test_read_nested_section(self, tmp_path):
+        """Test reading servers from a nested location, ignoring other data."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(
+            json.dumps(
+                {
+                    "history": [{"prompt": "x" * 100}] * 10,
+                    "mcp": {"config": {"mcpServers": {"s1": {"command": "a"}}}},
+                }
+            )
+        )
+
+        location = ConfigLocation(
+            app_name="Test",
+            path_template="",
+            file_type=FileType.JSON,
+            mcp_key=McpKey.CAMEL,
+            nested_path=["mcp", "config"],
+        )
+
+        config = read_mcp_servers(config_file, location)
+        assert config is not None
+        assert config.servers["s1"].command == "a"
+
+    def test_read_missing_section(self, tmp_path):
+        """Test reading a file without an MCP servers section."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"mcp": ["not", "a", "dict"]}))
+
+        location = ConfigLocation(
+            app_name="Test",
+            path_template="",
+            file_type=FileType.JSON,
+            mcp_key=McpKey.CAMEL,
+            nested_path=["mcp", "config"],
+        )
+
+        assert read_mcp_servers(config_file, location) is None
@@ -11,7 +11,29 @@ from synchromcp.config import (
     FileType,
     McpKey,
 )
-from synchromcp.sync import load_source, sync_configs
+from synchromcp.sync import (
+    load_source,
+    load_source_servers,
+    sync_configs,
+    sync_configs_stream,
+)
+from synchromcp.writers import convert_servers
+
+
+@pytest.fixture(scope="module")
+def source_with_one_server(tmp_path_factory):
+    """A read-only JSON source with a single server, written once per module."""
+    source = tmp_path_factory.mktemp("source") / "source.json"
+    source.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "server1": {"command": "test"},
+                }
+            }
+        )
+    )
+    return source
 
 
 class TestLoadSource:
@@ -76,21 +98,40 @@ class TestSyncConfigs:
 
         assert len(results) == 1
         assert results[0].success is True
+        assert results[0].skipped is False
 
         # Verify target was updated
-        written = json.loads(target.read_text())
+        written = json.loads(target.read_bytes())
         assert "new_server" in written["mcpServers"]
         assert "old_server" not in written["mcpServers"]
         assert written["theme"] == "dark"  # Other data preserved
 
-    def test_sync_dry_run(self, tmp_path):
-        """Test sync with dry-run mode."""
+    def test_sync_skips_target_already_in_sync(self, tmp_path):
+        """Test that a target matching the source is reported and not rewritten."""
         source = tmp_path / "source.json"
-        source.write_text(json.dumps({
-            "mcpServers": {
-                "server1": {"command": "test"},
+        source.write_text(json.dumps({"mcpServers": {"server1": {"command": "test"}}}))
+        target = tmp_path / "target.json"
+        original_content = json.dumps(
+            {
+                "theme": "dark",
+                "mcpServers": {"server1": {"command": "test"}},
             }
-        }))
+        )
+        target.write_text(original_content)
+
+        results = sync_configs(
+            source_path=source,
+            target_paths=[str(target)],
+        )
+
+        assert results[0].success is True
+        assert results[0].skipped is True
+        assert results[0].message == "Already up to date"
+        assert target.read_text() == original_content
+
+    def test_sync_dry_run(self, tmp_path, source_with_one_server):
+        """Test sync with dry-run mode."""
+        source = source_with_one_server
 
         target = tmp_path / "target.json"
         original_content = json.dumps({
@@ -113,14 +154,9 @@ class TestSyncConfigs:
         # Verify target was NOT changed
         assert target.read_text() == original_content
 
-    def test_sync_missing_target(self, tmp_path):
+    def test_sync_missing_target(self, tmp_path, source_with_one_server):
         """Test sync when target file doesn't exist."""
-        source = tmp_path / "source.json"
-        source.write_text(json.dumps({
-            "mcpServers": {
-                "server1": {"command": "test"},
-            }
-        }))
+        source = source_with_one_server
 
         results = sync_configs(
             source_path=source,
@@ -131,14 +167,25 @@ class TestSyncConfigs:
         assert results[0].success is False
         assert "not found" in results[0].message.lower()
 
-    def test_sync_multiple_targets(self, tmp_path):
+    def test_sync_dry_run_missing_target(self, tmp_path, source_with_one_server):
+        """Test that a dry run reports missing targets without creating them."""
+        source = source_with_one_server
+        missing = tmp_path / "missing.json"
+
+        results = sync_configs(
+            source_path=source,
+            target_paths=[str(missing)],
+            dry_run=True,
+        )
+
+        assert len(results) == 1
+        assert results[0].success is False
+        assert "not found" in results[0].message.lower()
+        assert not missing.exists()
+
+    def test_sync_multiple_targets(self, tmp_path, source_with_one_server):
         """Test syncing to multiple target files."""
-        source = tmp_path / "source.json"
-        source.write_text(json.dumps({
-            "mcpServers": {
-                "server1": {"command": "test"},
-            }
-        }))
+        source = source_with_one_server
 
         targets = []
         for i in range(3):
@@ -154,14 +201,59 @@ class TestSyncConfigs:
         assert len(results) == 3
         assert all(r.success for r in results)
 
-    def test_sync_source_excluded_from_targets(self, tmp_path):
+    def test_sync_results_in_target_order(self, tmp_path, source_with_one_server):
+        """Test that sync_configs reports targets in the order they were given."""
+        targets = [tmp_path / f"target{i}.json" for i in range(40)]
+        for target in targets:
+            target.write_text(json.dumps({"mcpServers": {}}))
+
+        results = sync_configs(
+            source_path=source_with_one_server,
+            target_paths=[str(t) for t in targets],
+        )
+
+        assert [r.path for r in results] == targets
+
+    def test_sync_stream_yields_each_target(self, tmp_path, source_with_one_server):
+        """Test that the streaming variant yields one result per target."""
+        targets = [tmp_path / f"target{i}.json" for i in range(3)]
+        for target in targets:
+            target.write_text(json.dumps({"mcpServers": {}}))
+
+        stream = sync_configs_stream(
+            source_path=source_with_one_server,
+            target_paths=[str(t) for t in targets],
+        )
+        results = list(stream)
+
+        assert sorted(r.path for r in results) == targets
+        assert all(r.success for r in results)
+
+    def test_sync_converts_servers_once(self, tmp_path, source_with_one_server):
+        """Test that the source servers are serialized once, not per target."""
+        source = source_with_one_server
+
+        targets = [tmp_path / f"target{i}.json" for i in range(3)]
+        for target in targets:
+            target.write_text(json.dumps({"mcpServers": {}}))
+
+        with patch(
+            "synchromcp.sync.convert_servers", side_effect=convert_servers
+        ) as convert:
+            results = sync_configs(
+                source_path=source,
+                target_paths=[str(t) for t in targets],
+            )
+
+        assert all(r.success for r in results)
+        assert convert.call_count == len(McpKey)
+        for target in targets:
+            data = json.loads(target.read_bytes())
+            assert data["mcpServers"] == {"server1": {"command": "test"}}
+
+    def test_sync_source_excluded_from_targets(self, source_with_one_server):
         """Test that source file is excluded from targets."""
-        source = tmp_path / "source.json"
-        source.write_text(json.dumps({
-            "mcpServers": {
-                "server1": {"command": "test"},
-            }
-        }))
+        source = source_with_one_server
 
         # Try to sync to source itself
         results = sync_configs(
@@ -172,6 +264,38 @@ class TestSyncConfigs:
         # Source should be filtered out
         assert len(results) == 0
 
+    def test_sync_symlink_to_source_excluded(self, tmp_path, source_with_one_server):
+        """Test that a target linking to the source is treated as the source."""
+        source = source_with_one_server
+        link = tmp_path / "link.json"
+        link.symlink_to(source)
+
+        results = sync_configs(
+            source_path=source,
+            target_paths=[str(link)],
+        )
+
+        assert len(results) == 0
+
+    def test_sync_duplicate_targets_deduplicated(
+        self, tmp_path, source_with_one_server
+    ):
+        """Test that a target reachable through two paths is synced once."""
+        source = source_with_one_server
+
+        target = tmp_path / "target.json"
+        target.write_text(json.dumps({"mcpServers": {}}))
+        alias = tmp_path / "sub" / ".." / "target.json"
+        (tmp_path / "sub").mkdir()
+
+        results = sync_configs(
+            source_path=source,
+            target_paths=[str(target), str(alias)],
+        )
+
+        assert len(results) == 1
+        assert results[0].success is True
+
     def test_sync_toml_source(self, tmp_path):
         """Test syncing from a TOML source file."""
         source = tmp_path / "source.toml"
@@ -197,7 +321,7 @@ args = ["server.py"]
         assert results[0].success is True
 
         # Verify target was updated
-        written = json.loads(target.read_text())
+        written = json.loads(target.read_bytes())
         assert "server1" in written["mcpServers"]
         assert "server2" in written["mcpServers"]
 
@@ -230,15 +354,9 @@ command = "old"
         assert "server1" in written["mcp_servers"]
         assert "old_server" not in written["mcp_servers"]
 
-    def test_sync_with_discovery(self, tmp_path, monkeypatch):
+    def test_sync_with_discovery(self, tmp_path, monkeypatch, source_with_one_server):
         """Test sync with automatic target discovery."""
-        # Create source
-        source = tmp_path / "source.json"
-        source.write_text(json.dumps({
-            "mcpServers": {
-                "server1": {"command": "test"},
-            }
-        }))
+        source = source_with_one_server
 
         # Mock discover_configs to return some test configs
         mock_discovered = [
@@ -304,7 +422,7 @@ command = "old"
         assert results[0].servers_count == 0
 
         # Verify target was cleared
-        written = json.loads(target.read_text())
+        written = json.loads(target.read_bytes())
         assert written["mcpServers"] == {}
 
 
@@ -342,6 +460,37 @@ TEST = "value"
         assert "test_server" in config.servers
         assert config.servers["test_server"].command == "python"
 
+    def test_load_source_cached_until_file_changes(self, tmp_path):
+        """Test that an unchanged source is parsed once per process."""
+        source_file = tmp_path / "source.json"
+        source_file.write_text(json.dumps({"mcpServers": {"a": {"command": "x"}}}))
+
+        _, first = load_source(source_file)
+        _, second = load_source(source_file)
+        assert second is first
+
+        source_file.write_text(
+            json.dumps({"mcpServers": {"a": {"command": "x"}, "b": {"command": "y"}}})
+        )
+        _, third = load_source(source_file)
+        assert set(third.servers) == {"a", "b"}
+
+    def test_load_source_cache_unaffected_by_to_dict_changes(self, tmp_path):
+        """Test that modifying converted servers leaves the cached source intact."""
+        server = {"command": "x", "args": ["1"], "env": {"A": "1"}, "extra": {"k": []}}
+        source_file = tmp_path / "source.json"
+        source_file.write_text(json.dumps({"mcpServers": {"a": server}}))
+
+        _, config = load_source(source_file)
+        converted = config.to_dict()["a"]
+        converted["args"].append("INJECTED")
+        converted["env"]["B"] = "2"
+        converted["extra"]["k"].append(1)
+        config.to_toml_dict()["a"]["args"].append("INJECTED")
+
+        _, reloaded = load_source(source_file)
+        assert reloaded.to_dict() == {"a": server}
+
     def test_load_missing_source(self, tmp_path):
         """Test loading a non-existent source file."""
         source_file = tmp_path / "missing.json"
@@ -372,6 +521,18 @@ TEST = "value"
         with pytest.raises(ValueError, match="No valid MCP servers"):
             load_source(source_file)
 
+    def test_load_source_servers_unvalidated(self, tmp_path):
+        """Test that the raw servers section is returned as stored."""
+        servers = {"invalid_server": {"environment": {"TEST": "value"}}}
+        source_file = tmp_path / "source.json"
+        source_file.write_text(json.dumps({"mcpServers": servers}))
+
+        assert load_source_servers(source_file) == (source_file, servers)
+
+        source_file.write_text(json.dumps({"theme": "dark"}))
+        with pytest.raises(ValueError, match="No MCP servers"):
+            load_source_servers(source_file)
+
     @patch('synchromcp.sync.get_default_source')
     def test_load_source_uses_default_when_none(self, mock_get_default, tmp_path):
         """Test that load_source uses get_default_source when source_path is None."""
@@ -1,10 +1,20 @@
 """Tests for file writers."""
 
 import json
+import os
+import tomllib
+
+import pytest
 
 from synchromcp.config import ConfigLocation, FileType, McpKey
 from synchromcp.models import McpServersConfig
-from synchromcp.writers import update_mcp_servers, write_config, write_json
+from synchromcp.writers import (
+    convert_servers,
+    update_mcp_servers,
+    write_config,
+    write_json,
+    write_toml,
+)
 
 
 class TestWriteJson:
@@ -21,6 +31,37 @@ class TestWriteJson:
         assert '"key": "value"' in content
         assert content.endswith("\n")
 
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions and symlinks")
+    def test_write_json_keeps_symlink_and_mode(self, tmp_path):
+        """Test that writing replaces the link target and keeps permissions."""
+        real_file = tmp_path / "real.json"
+        real_file.write_text("{}")
+        real_file.chmod(0o600)
+        link = tmp_path / "link.json"
+        link.symlink_to(real_file)
+
+        write_json(link, {"key": "value"})
+
+        assert link.is_symlink()
+        assert json.loads(real_file.read_text()) == {"key": "value"}
+        assert real_file.stat().st_mode & 0o777 == 0o600
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["link.json", "real.json"]
+
+    @pytest.mark.skipif(
+        not hasattr(os, "geteuid") or os.geteuid() != 0, reason="needs root"
+    )
+    def test_write_json_keeps_owner_as_root(self, tmp_path):
+        """Test that a file rewritten by root keeps its owner and group."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text("{}")
+        os.chown(config_file, 12345, 23456)
+
+        write_json(config_file, {"key": "value"})
+
+        info = config_file.stat()
+        assert (info.st_uid, info.st_gid) == (12345, 23456)
+        assert json.loads(config_file.read_text()) == {"key": "value"}
+
     def test_write_json_unicode(self, tmp_path):
         """Test writing JSON with unicode."""
         config_file = tmp_path / "config.json"
@@ -32,6 +73,22 @@ class TestWriteJson:
         assert "日本語" in content
 
 
+class TestWriteToml:
+    """Tests for TOML writing."""
+
+    def test_write_toml_round_trips(self, tmp_path):
+        """Test that mixed arrays and nested tables are written as valid TOML."""
+        config_file = tmp_path / "config.toml"
+        data = {
+            "mixed": [1, "a", {"x": 1}],
+            "mcp_servers": {"server1": {"command": "test", "env": {"KEY": "v"}}},
+        }
+
+        write_toml(config_file, data)
+
+        assert tomllib.loads(config_file.read_text(encoding="utf-8")) == data
+
+
 class TestUpdateMcpServers:
     """Tests for updating MCP servers section."""
 
@@ -69,6 +126,63 @@ class TestUpdateMcpServers:
         assert "mcpServers" in result
         assert "server1" in result["mcpServers"]
 
+    def test_update_with_converted_servers(self):
+        """Test passing servers already converted for the target key."""
+        config = McpServersConfig.from_dict(
+            {
+                "server1": {"command": "test", "alwaysAllow": ["tool1"]},
+            }
+        )
+        servers = convert_servers(config, McpKey.SNAKE)
+
+        result = update_mcp_servers({}, servers, McpKey.SNAKE)
+
+        assert result["mcp_servers"] is servers
+        assert result["mcp_servers"]["server1"]["always_allow"] == ["tool1"]
+
+    def test_update_nested_path_leaves_input_unchanged(self):
+        """Test that nested updates copy the touched branch only."""
+        settings = {"key": "value"}
+        data = {
+            "mcp": {"config": {"mcpServers": {}}, "other": 1},
+            "settings": settings,
+        }
+        config = McpServersConfig.from_dict({"server1": {"command": "test"}})
+
+        result = update_mcp_servers(data, config, McpKey.CAMEL, ["mcp", "config"])
+
+        assert "server1" in result["mcp"]["config"]["mcpServers"]
+        assert result["mcp"]["other"] == 1
+        assert result["settings"] is settings
+        assert data["mcp"]["config"]["mcpServers"] == {}
+
+    def test_update_inplace(self):
+        """Test that inplace updates modify the given dict and create the path."""
+        data = {"settings": {"key": "value"}}
+        config = McpServersConfig.from_dict({"server1": {"command": "test"}})
+
+        result = update_mcp_servers(
+            data, config, McpKey.CAMEL, ["mcp", "config"], inplace=True
+        )
+
+        assert result is data
+        assert data["mcp"] == {
+            "config": {"mcpServers": {"server1": {"command": "test"}}}
+        }
+        assert data["settings"] == {"key": "value"}
+
+    @pytest.mark.parametrize("inplace", [False, True])
+    def test_update_rejects_non_dict_on_path(self, inplace):
+        """Test that a non-dict value on the nested path is not overwritten."""
+        data = {"mcp": "not a dict"}
+        config = McpServersConfig.from_dict({"server1": {"command": "test"}})
+
+        with pytest.raises(TypeError, match="'mcp'"):
+            update_mcp_servers(
+                data, config, McpKey.CAMEL, ["mcp", "config"], inplace=inplace
+            )
+        assert data == {"mcp": "not a dict"}
+
 
 class TestWriteConfig:
     """Tests for full config writing."""
@@ -98,3 +212,39 @@ class TestWriteConfig:
         assert written["theme"] == "dark"
         assert "server1" in written["mcpServers"]
         assert written["mcpServers"]["server1"]["command"] == "npx"
+
+    def test_write_config_skips_unchanged_file(self, tmp_path):
+        """Test that a file already holding the servers is not rewritten."""
+        config_file = tmp_path / "config.json"
+        original = '{"mcpServers": {"server1": {"command": "npx"}}}'
+        config_file.write_text(original)
+        config = McpServersConfig.from_dict({"server1": {"command": "npx"}})
+        location = ConfigLocation(
+            app_name="Test",
+            path_template="",
+            file_type=FileType.JSON,
+            mcp_key=McpKey.CAMEL,
+        )
+
+        written = write_config(config_file, json.loads(original), config, location)
+
+        assert written is False
+        assert config_file.read_text() == original
+
+    def test_write_config_leaves_file_on_non_dict_path(self, tmp_path):
+        """Test that a conflicting nested value fails without touching the file."""
+        config_file = tmp_path / "config.json"
+        original = '{"mcp": ["not", "a", "dict"]}'
+        config_file.write_text(original)
+        config = McpServersConfig.from_dict({"server1": {"command": "npx"}})
+        location = ConfigLocation(
+            app_name="Test",
+            path_template="",
+            file_type=FileType.JSON,
+            mcp_key=McpKey.CAMEL,
+            nested_path=["mcp", "config"],
+        )
+
+        with pytest.raises(TypeError):
+            write_config(config_file, json.loads(original), config, location)
+        assert config_file.read_text() == original